@@ -32,6 +32,9 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    # Set ETags on GET responses and answer If-None-Match with 304s so
+    # browsers polling read-only pages skip the body transfer
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -79,6 +82,10 @@ if os.path.exists(config_path):
                 'PASSWORD': pg_cfg['password'],
                 'HOST': pg_cfg['host'],
                 'PORT': pg_cfg['port'],
+                # Reuse connections across requests instead of paying the
+                # TCP + auth handshake on every query
+                'CONN_MAX_AGE': 1800,
+                'CONN_HEALTH_CHECKS': True,
             }
         }
 else:
@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class MainConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main'
+
+    def ready(self):
+        # Import the indicator machinery while gunicorn's master loads the
+        # app, so forked workers inherit warm modules instead of each paying
+        # the import cost on their first request. stock_indicators is the one
+        # that matters: its pythonnet/CLR runtime takes seconds to start and
+        # is otherwise only imported lazily in StockIndicatorCalculator.
+        try:
+            from main.indicators import stock_indicator_adapter  # noqa: F401
+            import stock_indicators  # noqa: F401
+        except ImportError:
+            # Optional dependencies may be absent in dev environments
+            pass
@@ -0,0 +1,29 @@
+"""
+Shared HTTP plumbing for the collector management commands.
+
+Each collector talks to a single API host, so they all want the same
+session shape: a pooled keep-alive connection with compressed responses.
+"""
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Exponential backoff schedule for retried API calls, precomputed once
+BACKOFF_SCHEDULE = tuple(2.0 ** i for i in range(8))
+
+
+def build_session(pool_maxsize=8):
+    """Return a pooled keep-alive session for a single-host API client."""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
+    session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+    return session
+
+
+def backoff_sleep(attempt):
+    """Sleep before retry `attempt`, with jitter so concurrent runs that hit
+    a rate limit together do not retry in lockstep and collide again."""
+    delay = BACKOFF_SCHEDULE[min(attempt, len(BACKOFF_SCHEDULE) - 1)]
+    time.sleep(delay * random.uniform(0.5, 1.5))
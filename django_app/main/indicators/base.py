@@ -11,6 +11,11 @@ from typing import Dict, Any, Optional
 class BaseCalculator(ABC):
     """Base class for indicator calculators."""
     
+    # Calculators only ever hold their config (plus whatever slots a
+    # subclass declares); skipping the per-instance dict keeps the many
+    # short-lived instances created during range recalculations cheap
+    __slots__ = ('config',)
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the calculator with optional configuration.
@@ -4,7 +4,6 @@ Example indicator calculator implementations.
 These serve as templates for creating custom indicator calculators.
 """
 from datetime import date, timedelta
-from typing import Dict, Any
 from .base import BaseCalculator
 from main.models import Ticker, TickerData
 
@@ -22,6 +21,8 @@ class MovingAverageTrendCalculator(BaseCalculator):
         - long_period: Long MA period in days (default: 30)
     """
     
+    __slots__ = ()
+    
     def calculate(self, date: date, **kwargs) -> float:
         """Calculate moving average trend indicator."""
         # Get config
@@ -43,12 +44,16 @@ class MovingAverageTrendCalculator(BaseCalculator):
                 date__lte=end_date
             ).order_by('-date').values_list('close', flat=True)
             
-            if len(price_data) < long_period:
-                raise ValueError(f"Insufficient data for {ticker_symbol}: need {long_period} days, have {len(price_data)}")
-            
-            # Calculate moving averages
-            short_ma = sum(list(price_data)[:short_period]) / short_period
-            long_ma = sum(list(price_data)[:long_period]) / long_period
+            # Materialize the queryset once up front rather than leaning on
+            # its implicit result cache
+            prices = list(price_data)
+
+            if len(prices) < long_period:
+                raise ValueError(f"Insufficient data for {ticker_symbol}: need {long_period} days, have {len(prices)}")
+
+            # Calculate moving averages (prices are newest-first)
+            short_ma = sum(prices[:short_period]) / short_period
+            long_ma = sum(prices[:long_period]) / long_period
             
             # Calculate difference as percentage
             diff_percent = ((short_ma - long_ma) / long_ma) * 100
@@ -77,6 +82,8 @@ class VolatilityCalculator(BaseCalculator):
         - threshold: Volatility threshold for normalization (default: 5.0)
     """
     
+    __slots__ = ()
+    
     def calculate(self, date: date, **kwargs) -> float:
         """Calculate volatility indicator."""
         ticker_symbol = self.config.get('ticker', 'X:BTCUSD')
@@ -128,6 +135,8 @@ class SimpleThresholdCalculator(BaseCalculator):
         - threshold: Value to return (default: 0.5)
     """
     
+    __slots__ = ()
+    
     def calculate(self, date: date, **kwargs) -> float:
         """Return configured threshold value."""
         value = self.config.get('threshold', 0.5)
@@ -6,6 +6,7 @@ indicators using the stock-indicators package.
 """
 from typing import Dict, Any, Optional, List
 from datetime import date, timedelta
+from django.core.cache import cache
 from main.models import Indicator, IndicatorType
 from main.indicators import create_settings, SETTINGS_REGISTRY
 
@@ -239,13 +240,50 @@ def calculate_indicator_for_date_range(
     """
     from main.models import IndicatorData
     from django.utils import timezone
-    
+
     results = []
     current_date = start_date
-    
+
+    # Build the calculator once for the whole range; calculate_value() would
+    # re-import the calculator class and re-parse its config on every date
+    try:
+        calculator = indicator.get_calculator()
+    except Exception:
+        calculator = None
+
+    if calculator is None:
+        return results
+
+    # Calculators that can evaluate a whole range in one pass expose
+    # calculate_series; use it and skip the per-date loop entirely
+    if hasattr(calculator, 'calculate_series'):
+        try:
+            series = calculator.calculate_series(start_date, end_date)
+        except Exception:
+            series = []
+
+        timestamp = timezone.now().isoformat()
+        for series_date, value in series:
+            results.append({
+                'date': series_date,
+                'value': value
+            })
+
+            if save_to_db:
+                IndicatorData.objects.update_or_create(
+                    indicator=indicator,
+                    date=series_date,
+                    defaults={
+                        'value': value,
+                        'updated_at': timestamp
+                    }
+                )
+
+        return results
+
     while current_date <= end_date:
         try:
-            value = indicator.calculate_value(date=current_date)
+            value = calculator.calculate(date=current_date)
             
             results.append({
                 'date': current_date,
@@ -336,6 +374,13 @@ def get_indicator_score_summary(
     if target_date is None:
         target_date = date.today()
     
+    # Recomputing runs every indicator's calculator; serve repeat requests
+    # for the same ticker/date from the cache for a few minutes
+    cache_key = f'indicator_score_summary_{ticker}_{target_date.isoformat()}'
+    summary = cache.get(cache_key)
+    if summary is not None:
+        return summary
+    
     # Get all indicators for this ticker
     indicators = Indicator.objects.filter(
         calculation_type='stock_indicator',
@@ -359,20 +404,34 @@ def get_indicator_score_summary(
             # Skip indicators that fail
             pass
     
-    # Calculate overall score
-    overall_score = sum(scores) / len(scores) if scores else 0.0
+    # Total and sentiment buckets in a single pass; the previous version
+    # walked the score list four times
+    total = 0.0
+    bullish_count = 0
+    bearish_count = 0
+    for score in scores:
+        total += score
+        if score > 0.3:
+            bullish_count += 1
+        elif score < -0.3:
+            bearish_count += 1
+    
+    overall_score = total / len(scores) if scores else 0.0
     
-    return {
+    summary = {
         'ticker': ticker,
         'date': target_date,
         'overall_score': overall_score,
         'overall_sentiment': _score_to_sentiment(overall_score),
         'indicator_count': len(scores),
         'indicators': indicator_details,
-        'bullish_count': sum(1 for s in scores if s > 0.3),
-        'bearish_count': sum(1 for s in scores if s < -0.3),
-        'neutral_count': sum(1 for s in scores if -0.3 <= s <= 0.3),
+        'bullish_count': bullish_count,
+        'bearish_count': bearish_count,
+        'neutral_count': len(scores) - bullish_count - bearish_count,
     }
+    
+    cache.set(cache_key, summary, timeout=300)
+    return summary
 
 
 def _score_to_sentiment(score: float) -> str:
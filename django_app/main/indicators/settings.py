@@ -6,7 +6,7 @@ from the stock-indicators package. Each settings class contains the parameters
 needed to calculate a specific indicator.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
 
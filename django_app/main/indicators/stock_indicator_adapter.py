@@ -29,10 +29,38 @@ class StockIndicatorCalculator(BaseCalculator):
         - lookback_days: Additional days to fetch for calculation buffer (default: 100)
     """
     
+    __slots__ = ('_quote_cache', 'stock_indicators')
+    
+    # Indicators grouped by the scoring method that suits them, as
+    # frozensets so auto-detection is a hash lookup against shared constants
+    THRESHOLD_INDICATORS = frozenset({'rsi', 'stoch', 'cci', 'williams_r'})
+    MOMENTUM_INDICATORS = frozenset({'macd', 'obv'})
+    
+    # Map our names to stock-indicators function names; class-level so the
+    # dict is built once, not per calculation
+    INDICATOR_FUNCTIONS = {
+        'rsi': 'get_rsi',
+        'macd': 'get_macd',
+        'sma': 'get_sma',
+        'ema': 'get_ema',
+        'bollinger_bands': 'get_bollinger_bands',
+        'stoch': 'get_stoch',
+        'atr': 'get_atr',
+        'adx': 'get_adx',
+        'cci': 'get_cci',
+        'williams_r': 'get_williams_r',
+        'obv': 'get_obv',
+        'psar': 'get_psar',
+        'ichimoku': 'get_ichimoku',
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the calculator with configuration."""
         super().__init__(config)
         
+        # Superset quote cache per ticker: (start_date, end_date, quotes)
+        self._quote_cache = {}
+        
         # Import stock-indicators
         try:
             from stock_indicators import indicators
@@ -112,38 +140,55 @@ class StockIndicatorCalculator(BaseCalculator):
         Returns:
             List of quote dictionaries with keys: date, open, high, low, close, volume
         """
+        # Get sufficient data for calculation
+        lookback_days = self.config.get('lookback_days', 100)
+        start_date = end_date - timedelta(days=lookback_days)
+        
+        # Range recalculations call this once per date with heavily
+        # overlapping windows; serve subranges from the cached superset and
+        # only hit the database when the window falls outside it
+        cached = self._quote_cache.get(ticker_symbol)
+        if cached is None or cached[0] > start_date or cached[1] < end_date:
+            cached = self._load_quotes(ticker_symbol, start_date, end_date)
+        
+        quotes = [q for q in cached[2] if start_date <= q['date'] <= end_date]
+        
+        if not quotes:
+            raise ValueError(f"No data available for {ticker_symbol}")
+        
+        return quotes
+    
+    def _load_quotes(self, ticker_symbol: str, start_date: date, end_date: date) -> Tuple[date, date, List[Dict[str, Any]]]:
+        """
+        Load quotes from the database and refresh the superset cache.
+        
+        Fetches a year past the requested end so a forward-walking range
+        recalculation keeps hitting the cache instead of re-querying per date.
+        """
         try:
             ticker = Ticker.objects.get(ticker=ticker_symbol)
         except Ticker.DoesNotExist:
             raise ValueError(f"Ticker {ticker_symbol} not found")
         
-        # Get sufficient data for calculation
-        lookback_days = self.config.get('lookback_days', 100)
-        start_date = end_date - timedelta(days=lookback_days)
+        fetch_end = end_date + timedelta(days=365)
         
-        # Fetch data
+        # Fetch data; bars without a close are useless to every indicator,
+        # so drop them in the query rather than downstream
         ticker_data = TickerData.objects.filter(
             ticker=ticker,
             date__gte=start_date,
-            date__lte=end_date
+            date__lte=fetch_end,
+            close__isnull=False
         ).order_by('date').values('date', 'open', 'high', 'low', 'close', 'volume')
         
-        if not ticker_data:
-            raise ValueError(f"No data available for {ticker_symbol}")
-        
-        # Convert to stock-indicators format
-        quotes = []
-        for data in ticker_data:
-            quotes.append({
-                'date': data['date'],
-                'open': float(data['open']) if data['open'] is not None else None,
-                'high': float(data['high']) if data['high'] is not None else None,
-                'low': float(data['low']) if data['low'] is not None else None,
-                'close': float(data['close']) if data['close'] is not None else None,
-                'volume': float(data['volume']) if data['volume'] is not None else None,
-            })
+        # The OHLCV columns are FloatFields, so the driver already hands back
+        # floats (or None); re-casting each value was five no-op conversions
+        # and five None checks per row
+        quotes = list(ticker_data)
         
-        return quotes
+        entry = (start_date, fetch_end, quotes)
+        self._quote_cache[ticker_symbol] = entry
+        return entry
     
     def _calculate_indicator(
         self, 
@@ -162,25 +207,7 @@ class StockIndicatorCalculator(BaseCalculator):
         Returns:
             List of indicator results
         """
-        # Get indicator function from stock-indicators
-        # Map our names to stock-indicators function names
-        indicator_map = {
-            'rsi': 'get_rsi',
-            'macd': 'get_macd',
-            'sma': 'get_sma',
-            'ema': 'get_ema',
-            'bollinger_bands': 'get_bollinger_bands',
-            'stoch': 'get_stoch',
-            'atr': 'get_atr',
-            'adx': 'get_adx',
-            'cci': 'get_cci',
-            'williams_r': 'get_williams_r',
-            'obv': 'get_obv',
-            'psar': 'get_psar',
-            'ichimoku': 'get_ichimoku',
-        }
-        
-        func_name = indicator_map.get(indicator_name)
+        func_name = self.INDICATOR_FUNCTIONS.get(indicator_name)
         if not func_name:
             raise ValueError(f"Indicator {indicator_name} not supported")
         
@@ -246,12 +273,9 @@ class StockIndicatorCalculator(BaseCalculator):
     
     def _get_auto_score_method(self, indicator_name: str) -> str:
         """Automatically determine best scoring method for indicator."""
-        threshold_indicators = ['rsi', 'stoch', 'cci', 'williams_r']
-        momentum_indicators = ['macd', 'obv']
-        
-        if indicator_name in threshold_indicators:
+        if indicator_name in self.THRESHOLD_INDICATORS:
             return 'threshold'
-        elif indicator_name in momentum_indicators:
+        elif indicator_name in self.MOMENTUM_INDICATORS:
             return 'momentum'
         else:
             return 'range'
@@ -0,0 +1,39 @@
+"""
+Django management command to seed the default indicator types.
+
+Usage:
+    python manage.py create_indicator_types
+"""
+from django.core.management.base import BaseCommand
+from datetime import datetime
+from main.models import IndicatorType
+
+DEFAULT_TYPES = [
+    {'name': 'Technical', 'description': 'Technical analysis indicators based on price and volume data', 'color': '#3B82F6'},
+    {'name': 'Fundamental', 'description': 'Indicators derived from on-chain and network fundamentals', 'color': '#10B981'},
+    {'name': 'Sentiment', 'description': 'Market sentiment and positioning indicators', 'color': '#F59E0B'},
+    {'name': 'Macro', 'description': 'Macro-economic indicators such as liquidity and rates', 'color': '#8B5CF6'},
+]
+
+
+class Command(BaseCommand):
+    help = 'Seed the default indicator types'
+
+    def handle(self, *args, **options):
+        now_iso = datetime.now().isoformat()
+
+        # One INSERT ... ON CONFLICT (name) DO NOTHING for all defaults
+        # instead of a check-then-create round-trip per type
+        created = IndicatorType.objects.bulk_create(
+            [
+                IndicatorType(created_at=now_iso, updated_at=now_iso, **type_def)
+                for type_def in DEFAULT_TYPES
+            ],
+            ignore_conflicts=True
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Seeded indicator types ({len(created)} submitted, existing names left untouched)"
+        ))
+        for type_def in DEFAULT_TYPES:
+            self.stdout.write(f"  - {type_def['name']}")
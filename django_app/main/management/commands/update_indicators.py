@@ -7,10 +7,14 @@ Usage:
     python manage.py update_indicators --date 2026-01-08
 """
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from main.models import Indicator, IndicatorData
 
+# Indicators are independent of each other, so compute a few at once; the
+# work is dominated by quote queries and the stock-indicators runtime
+COMPUTE_WORKERS = 4
+
 
 class Command(BaseCommand):
     help = 'Automatically update indicators using their calculator classes'
@@ -62,44 +66,54 @@ class Command(BaseCommand):
         error_count = 0
         skipped_count = 0
         
+        # One query for the date's existing rows instead of one per indicator
+        existing_by_indicator = {
+            dp.indicator_id: dp
+            for dp in IndicatorData.objects.filter(indicator__in=indicators, date=target_date)
+        }
+        
+        to_compute = []
         for indicator in indicators:
+            if existing_by_indicator.get(indicator.id) and not options['force']:
+                self.stdout.write(f"⊘ {indicator.title}: Data already exists (use --force to overwrite)")
+                skipped_count += 1
+            else:
+                to_compute.append(indicator)
+        
+        def compute(indicator):
             try:
-                # Check if data already exists
-                existing = IndicatorData.objects.filter(
-                    indicator=indicator,
-                    date=target_date
-                ).first()
-                
-                if existing and not options['force']:
-                    self.stdout.write(f"⊘ {indicator.title}: Data already exists (use --force to overwrite)")
-                    skipped_count += 1
+                return indicator.calculate_value(date=target_date), None
+            except Exception as e:
+                return None, str(e)
+        
+        # Calculate on a small pool; saves and output stay on the main
+        # thread, in submission order
+        with ThreadPoolExecutor(max_workers=COMPUTE_WORKERS) as pool:
+            for indicator, (value, error) in zip(to_compute, pool.map(compute, to_compute)):
+                if error is not None:
+                    self.stdout.write(self.style.ERROR(f"✗ {indicator.title}: {error}"))
+                    error_count += 1
                     continue
                 
-                # Calculate value
-                self.stdout.write(f"→ {indicator.title}: Calculating...", ending=' ')
-                value = indicator.calculate_value(date=target_date)
+                now_iso = datetime.now().isoformat()
+                existing = existing_by_indicator.get(indicator.id)
                 
-                # Save or update
                 if existing:
                     existing.value = value
-                    existing.updated_at = datetime.now().isoformat()
+                    existing.updated_at = now_iso
                     existing.save()
-                    self.stdout.write(self.style.SUCCESS(f"Updated: {value:.3f}"))
+                    self.stdout.write(self.style.SUCCESS(f"→ {indicator.title}: Updated: {value:.3f}"))
                 else:
                     IndicatorData.objects.create(
                         indicator=indicator,
                         date=target_date,
                         value=value,
-                        created_at=datetime.now().isoformat(),
-                        updated_at=datetime.now().isoformat()
+                        created_at=now_iso,
+                        updated_at=now_iso
                     )
-                    self.stdout.write(self.style.SUCCESS(f"Created: {value:.3f}"))
+                    self.stdout.write(self.style.SUCCESS(f"→ {indicator.title}: Created: {value:.3f}"))
                 
                 success_count += 1
-                
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"\n  Error: {str(e)}"))
-                error_count += 1
         
         # Summary
         self.stdout.write(self.style.SUCCESS(f"\n=== Complete ==="))
@@ -2,16 +2,25 @@
 Django management command to fetch market cap data from CoinGecko API.
 """
 from django.core.management.base import BaseCommand
-from django.db.models import Q
 from datetime import datetime
 import requests
+from main.http_utils import build_session
 import time
 from main.models import Ticker
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Command(BaseCommand):
     help = 'Update market cap data for tickers from CoinGecko API'
 
+    # Quote currencies used to build X:<symbol><currency> pattern matches;
+    # defined once instead of rebuilding the pattern list per cryptocurrency
+    PATTERN_CURRENCIES = ('USD', 'EUR', 'GBP', 'JPY', 'AUD')
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--limit',
@@ -51,7 +60,7 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'Fetched {len(crypto_data)} cryptocurrencies'))
         
         # Update matching tickers
-        updated_count = self.update_tickers(crypto_data, dry_run)
+        updated_count = self.update_tickers(crypto_data, dry_run, options['verbosity'])
         
         if dry_run:
             self.stdout.write(self.style.SUCCESS(f'DRY RUN: Would have updated {updated_count} tickers'))
@@ -67,6 +76,9 @@ class Command(BaseCommand):
         """
         crypto_data = []
         base_url = "https://api.coingecko.com/api/v3/coins/markets"
+
+        # One pooled session with keep-alive and gzip for all pages
+        session = build_session(pool_maxsize=4)
         
         # CoinGecko API allows up to 250 results per page
         per_page = min(250, limit)
@@ -85,10 +97,12 @@ class Command(BaseCommand):
             self.stdout.write(f'Fetching page {page}/{pages_needed}...')
             
             try:
-                response = requests.get(base_url, params=params, timeout=30)
+                response = session.get(base_url, params=params, timeout=30)
                 response.raise_for_status()
                 
-                data = response.json()
+                # 250-coin market pages are the largest payloads this command
+                # sees; decode with orjson when installed
+                data = orjson.loads(response.content) if orjson else response.json()
                 
                 for coin in data:
                     crypto_data.append({
@@ -122,55 +136,54 @@ class Command(BaseCommand):
         
         return crypto_data
 
-    def update_tickers(self, crypto_data, dry_run=False):
+    def update_tickers(self, crypto_data, dry_run=False, verbosity=1):
         """
         Update tickers in the database with market cap data.
         
         Matches cryptocurrencies by symbol and updates their market_cap field.
+        Per-ticker lines are only written on dry runs or at verbosity >= 2;
+        hundreds of writes per run otherwise dominate the loop and bloat the
+        captured output on the progress page.
         """
         updated_count = 0
         skipped_count = 0
-        
+        verbose = dry_run or verbosity >= 2
+
+        # Load the ticker table once and build lookup maps; matching per coin
+        # previously issued up to seven queries per cryptocurrency
+        by_crypto_symbol = {}
+        by_ticker = {}
+        by_currency = {}
+        for ticker in Ticker.objects.all():
+            if ticker.crypto_symbol:
+                by_crypto_symbol.setdefault(ticker.crypto_symbol.upper(), []).append(ticker)
+            by_ticker.setdefault(ticker.ticker.upper(), []).append(ticker)
+            for currency in (ticker.currency_symbol, ticker.base_currency_symbol):
+                if currency:
+                    by_currency.setdefault(currency.upper(), []).append(ticker)
+
         for crypto in crypto_data:
             symbol = crypto['symbol']
             market_cap = crypto['market_cap']
             name = crypto.get('name')
-            
+
             # Skip if market cap is None
             if market_cap is None:
                 continue
-            
+
             # Try to find matching tickers using more precise matching
             # Priority: exact crypto_symbol match > ticker pattern match > currency symbol match
-            matching_tickers = []
-            
-            # First, try exact crypto_symbol match
-            exact_matches = Ticker.objects.filter(crypto_symbol__iexact=symbol)
-            if exact_matches.exists():
-                matching_tickers = list(exact_matches)
-            else:
+            matching_tickers = list(by_crypto_symbol.get(symbol, []))
+
+            if not matching_tickers:
                 # Try ticker pattern matches (more precise than icontains)
                 # Match X:BTCUSD pattern or similar with word boundaries
-                ticker_patterns = [
-                    f'X:{symbol}USD',  # e.g., X:BTCUSD
-                    f'X:{symbol}EUR',  # e.g., X:BTCEUR
-                    f'X:{symbol}GBP',  # e.g., X:BTCGBP
-                    f'X:{symbol}JPY',  # e.g., X:BTCJPY
-                    f'X:{symbol}AUD',  # e.g., X:BTCAUD
-                ]
-                
-                for pattern in ticker_patterns:
-                    matches = Ticker.objects.filter(ticker__iexact=pattern)
-                    matching_tickers.extend(matches)
-                
+                for currency in self.PATTERN_CURRENCIES:
+                    matching_tickers.extend(by_ticker.get(f'X:{symbol}{currency}', []))
+
                 # If no pattern matches, try currency_symbol (but only for exact matches)
                 if not matching_tickers:
-                    currency_matches = Ticker.objects.filter(
-                        Q(currency_symbol__iexact=symbol) |
-                        Q(base_currency_symbol__iexact=symbol)
-                    )
-                    # Filter out tickers that have a different crypto_symbol set
-                    for ticker in currency_matches:
+                    for ticker in by_currency.get(symbol, []):
                         if not ticker.crypto_symbol or ticker.crypto_symbol.upper() == symbol:
                             matching_tickers.append(ticker)
             
@@ -187,15 +200,16 @@ class Command(BaseCommand):
                         ticker.last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                         ticker.save()
                         
-                        self.stdout.write(
-                            f'Updated {ticker.ticker}: {symbol} ({name}) -> '
-                            f'${market_cap:,.0f} (was: ${old_market_cap or 0:,.0f})'
-                        )
+                        if verbose:
+                            self.stdout.write(
+                                f'Updated {ticker.ticker}: {symbol} ({name}) -> '
+                                f'${market_cap:,.0f} (was: ${old_market_cap or 0:,.0f})'
+                            )
                     
                     updated_count += 1
             else:
                 skipped_count += 1
-                if dry_run or skipped_count <= 10:  # Only show first 10 skipped to reduce noise
+                if verbose and skipped_count <= 10:  # Only show first 10 skipped to reduce noise
                     self.stdout.write(
                         self.style.WARNING(f'No matching ticker found for {symbol} ({name})')
                     )
@@ -10,11 +10,53 @@ Usage:
 from django.core.management.base import BaseCommand
 from django.db.models import Max
 from django.conf import settings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import threading
 import time
-import requests
+from main.http_utils import build_session, backoff_sleep
 from main.models import Ticker, TickerData
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Default fetch threads; the token bucket still caps the aggregate request rate
+DEFAULT_WORKERS = 4
+
+
+class TokenBucket:
+    """Token-bucket rate limiter.
+
+    Allows short bursts up to `capacity` calls while enforcing a steady-state
+    rate, and never sleeps when no API call is actually made.
+
+    Thread-safe: commands can run concurrently in background threads from the
+    data-updates page, so refill/consume happens under a lock.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cost=1.0):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                wait = (cost - self.tokens) / self.rate
+            # Sleep outside the lock so other threads can refill/consume
+            time.sleep(wait)
+
 
 class Command(BaseCommand):
     help = 'Update ticker historical price data from Polygon API'
@@ -30,6 +72,12 @@ class Command(BaseCommand):
             type=int,
             help='Limit number of tickers to process'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help='Number of concurrent fetch threads (default: %(default)s)'
+        )
 
     def get_date_range_for_ticker(self, ticker_obj):
         """Get the date range that needs to be collected for a ticker."""
@@ -63,63 +111,77 @@ class Command(BaseCommand):
             'apiKey': settings.POLYGON_API_KEY
         }
         
-        try:
-            resp = requests.get(url, params=params, timeout=settings.POLYGON_TIMEOUT)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            if data.get('status') == 'OK' and data.get('results'):
-                return data['results']
-            return []
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"  Error fetching data for {ticker}: {e}"))
-            return []
+        for attempt in range(settings.POLYGON_MAX_RETRIES + 1):
+            try:
+                resp = self.session.get(url, params=params, timeout=settings.POLYGON_TIMEOUT)
+                resp.raise_for_status()
+                # Aggregate responses can be tens of thousands of bars; orjson
+                # decodes them several times faster when it is available
+                data = orjson.loads(resp.content) if orjson else resp.json()
+                
+                if data.get('status') == 'OK' and data.get('results'):
+                    return data['results']
+                return []
+            except Exception as e:
+                if attempt >= settings.POLYGON_MAX_RETRIES:
+                    self.stdout.write(self.style.ERROR(f"  Error fetching data for {ticker}: {e}"))
+                    return []
+                backoff_sleep(attempt)
+        return []
 
     def save_ticker_data(self, ticker_obj, daily_data):
         """Save daily price data to database."""
         collected_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        saved_count = 0
         
-        for bar in daily_data:
-            # Convert timestamp (milliseconds) to date
-            date = datetime.fromtimestamp(bar['t'] / 1000).date()
-            
-            # Use get_or_create to avoid duplicate key errors
-            _, created = TickerData.objects.get_or_create(
+        # Build all rows up front and insert them in one statement;
+        # get_or_create cost two round-trips per bar, which dominated
+        # backfills of a year or more of history
+        rows = [
+            TickerData(
                 ticker=ticker_obj,
-                date=date,
-                defaults={
-                    'open': bar.get('o'),
-                    'high': bar.get('h'),
-                    'low': bar.get('l'),
-                    'close': bar.get('c'),
-                    'volume': bar.get('v'),
-                    'vwap': bar.get('vw'),
-                    'transactions': bar.get('n'),
-                    'collected_at': collected_at
-                }
+                date=datetime.fromtimestamp(bar['t'] / 1000).date(),
+                open=bar.get('o'),
+                high=bar.get('h'),
+                low=bar.get('l'),
+                close=bar.get('c'),
+                volume=bar.get('v'),
+                vwap=bar.get('vw'),
+                transactions=bar.get('n'),
+                collected_at=collected_at
             )
-            
-            if created:
-                saved_count += 1
-        
-        return saved_count
+            for bar in daily_data
+        ]
+        
+        # ignore_conflicts keeps the old get_or_create semantics: bars we
+        # already hold are left untouched. It also makes bulk_create's return
+        # value useless for counting (every submitted row comes back, inserted
+        # or not), so measure the actual inserts with row counts instead.
+        existing = TickerData.objects.filter(ticker=ticker_obj).count()
+        TickerData.objects.bulk_create(rows, ignore_conflicts=True)
+        return TickerData.objects.filter(ticker=ticker_obj).count() - existing
 
-    def process_ticker(self, ticker_obj, rate_limit_delay):
-        """Process a single ticker to collect its historical data."""
-        ticker_symbol = ticker_obj.ticker
-        
-        # Check what date range we need
+    def fetch_ticker_payload(self, ticker_obj, bucket):
+        """Fetch phase, run on worker threads: date-range lookup + API call."""
         from_date, to_date = self.get_date_range_for_ticker(ticker_obj)
         
         if not from_date or not to_date:
+            return ticker_obj, None, []
+        
+        # Wait for rate-limit budget, then fetch data from Polygon
+        bucket.acquire()
+        daily_data = self.fetch_daily_data(ticker_obj.ticker, from_date, to_date)
+        return ticker_obj, (from_date, to_date), daily_data
+
+    def process_fetched(self, ticker_obj, date_range, daily_data):
+        """Save phase, run on the main thread so ORM writes stay serialized."""
+        ticker_symbol = ticker_obj.ticker
+        
+        if date_range is None:
             self.stdout.write(f"✓ {ticker_symbol}: Already up to date")
             return 0
         
-        self.stdout.write(f"→ {ticker_symbol}: Fetching data from {from_date} to {to_date}")
-        
-        # Fetch data from Polygon
-        daily_data = self.fetch_daily_data(ticker_symbol, from_date, to_date)
+        from_date, to_date = date_range
+        self.stdout.write(f"→ {ticker_symbol}: Fetched data from {from_date} to {to_date}")
         
         if not daily_data:
             # Check if ticker has no data for the last 7 days
@@ -145,14 +207,20 @@ class Command(BaseCommand):
         saved_count = self.save_ticker_data(ticker_obj, daily_data)
         self.stdout.write(self.style.SUCCESS(f"  {ticker_symbol}: Saved {saved_count} records"))
         
-        # Rate limiting for basic tier (5 requests per minute)
-        time.sleep(rate_limit_delay)
-        
         return saved_count
 
     def handle(self, *args, **options):
-        # Get rate limit delay from settings
+        workers = max(1, options['workers'])
+        
+        # One pooled session for the whole run; reconnecting per ticker pays
+        # the TCP+TLS handshake on every call
+        self.session = build_session(pool_maxsize=workers)
+
+        # Rate limiting for basic tier: steady-state one call per
+        # POLYGON_RATE_LIMIT_DELAY seconds, with small bursts allowed
         rate_limit_delay = settings.POLYGON_RATE_LIMIT_DELAY
+        rate = 1.0 / rate_limit_delay if rate_limit_delay > 0 else 1000.0
+        bucket = TokenBucket(rate=rate, capacity=5)
         
         # Get tickers to process
         query = Ticker.objects.filter(active=True)
@@ -168,9 +236,13 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f"\n=== Processing {len(tickers)} tickers ===\n"))
         
         total_saved = 0
-        for i, ticker_obj in enumerate(tickers, 1):
-            self.stdout.write(f"[{i}/{len(tickers)}] ", ending="")
-            saved = self.process_ticker(ticker_obj, rate_limit_delay)
-            total_saved += saved
+        # Overlap network waits across a few fetch threads; results come back
+        # in submission order so the progress output stays sequential
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda t: self.fetch_ticker_payload(t, bucket), tickers)
+            for i, (ticker_obj, date_range, daily_data) in enumerate(results, 1):
+                self.stdout.write(f"[{i}/{len(tickers)}] ", ending="")
+                saved = self.process_fetched(ticker_obj, date_range, daily_data)
+                total_saved += saved
         
         self.stdout.write(self.style.SUCCESS(f"\n=== Complete: Saved {total_saved} total records ===\n"))
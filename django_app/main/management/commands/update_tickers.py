@@ -3,10 +3,17 @@ Django management command to update ticker list from Polygon API.
 """
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.db import transaction
 from datetime import datetime
 import requests
+from main.http_utils import build_session, backoff_sleep
 from main.models import Ticker
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Command(BaseCommand):
     help = 'Update ticker list from Polygon API'
@@ -41,6 +48,10 @@ class Command(BaseCommand):
 
     def fetch_polygon_tickers(self):
         """Fetch all crypto tickers from Polygon API."""
+        # One pooled session for all pages; a fresh requests.get would pay
+        # the TCP+TLS handshake on every page
+        session = build_session()
+
         url = f"{settings.POLYGON_BASE_URL}/v3/reference/tickers"
         params = {
             'market': 'crypto',
@@ -59,9 +70,7 @@ class Command(BaseCommand):
             self.stdout.write(f'Fetching page {page_count}...')
             
             try:
-                resp = requests.get(url, params=params, timeout=settings.POLYGON_TIMEOUT)
-                resp.raise_for_status()
-                data = resp.json()
+                data = self.fetch_page(session, url, params)
                 
                 results = data.get('results', [])
                 tickers.extend(results)
@@ -81,8 +90,28 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'Total tickers fetched: {len(tickers)}'))
         return tickers
 
+    def fetch_page(self, session, url, params):
+        """Fetch one reference page, retrying transient errors with backoff."""
+        for attempt in range(settings.POLYGON_MAX_RETRIES + 1):
+            try:
+                resp = session.get(url, params=params, timeout=settings.POLYGON_TIMEOUT)
+                resp.raise_for_status()
+                # orjson parses the big reference pages several times faster
+                # than the stdlib decoder when it is available
+                return orjson.loads(resp.content) if orjson else resp.json()
+            except requests.exceptions.RequestException:
+                if attempt >= settings.POLYGON_MAX_RETRIES:
+                    raise
+                backoff_sleep(attempt)
+
+    @transaction.atomic
     def save_tickers_to_db(self, tickers):
-        """Save or update tickers in the database."""
+        """Save or update tickers in the database.
+
+        Runs inside one transaction: thousands of update_or_create calls each
+        paid their own BEGIN/COMMIT in autocommit mode, and a half-finished
+        refresh no longer leaves the ticker list inconsistent.
+        """
         updated_count = 0
         created_count = 0
         skipped_count = 0
@@ -104,7 +133,10 @@ class Command(BaseCommand):
             # Extract crypto symbol from ticker
             crypto_symbol = ''
             if ticker.startswith('X:') and ticker.endswith('USD'):
-                crypto_symbol = ticker.replace('X:', '').replace('USD', '')
+                # Slice out the symbol between the checked prefix and suffix;
+                # the old replace() chain also mangled symbols that themselves
+                # contain 'USD' (X:USDCUSD -> 'C' instead of 'USDC')
+                crypto_symbol = ticker[2:-3]
             elif '-' in ticker:
                 parts = ticker.split('-')
                 if len(parts) >= 2:
@@ -1,19 +1,23 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.db.models import Min, Max, Count, Q
+from django.db.models import Avg, Min, Max, Count, Q
 from django.core.management import call_command
 from django.core.cache import cache
 from django.http import JsonResponse
 from datetime import datetime, timedelta
 import json
-import subprocess
-import sys
 import os
 import threading
 import uuid
 from io import StringIO
+from types import SimpleNamespace
 from .models import Ticker, TickerData, GlobalLiquidity, IndicatorType, Indicator, IndicatorData
 
+# Project directories for legacy update scripts (computed once at import,
+# not on every request)
+DJANGO_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(DJANGO_APP_DIR)
+
 
 # ====================
 # Home View (redirects to tickers)
@@ -60,34 +64,31 @@ def index(request):
             Q(crypto_symbol__icontains=search)
         )
     
-    # Get date ranges for each ticker from ticker_data
+    # Get date ranges for each ticker from ticker_data, annotated in the same
+    # query instead of one aggregate round-trip per ticker
+    tickers = tickers.annotate(
+        data_start_date=Min('ticker_data__date'),
+        data_end_date=Max('ticker_data__date')
+    )
+
     ticker_data_ranges = {}
     today = datetime.now().date()
-    
+
     # Convert to list to allow modification
     tickers_list = list(tickers)
-    
+
     for ticker in tickers_list:
-        date_range = TickerData.objects.filter(ticker=ticker).aggregate(
-            start_date=Min('date'),
-            end_date=Max('date')
-        )
-        
-        if date_range['start_date']:
-            end_date = date_range['end_date']
+        if ticker.data_start_date:
+            end_date = ticker.data_end_date
             days_old = (today - end_date).days if end_date else None
             ticker_data_ranges[ticker.ticker] = {
-                'start_date': date_range['start_date'],
+                'start_date': ticker.data_start_date,
                 'end_date': end_date,
                 'days_old': days_old
             }
             # Attach computed data directly to ticker object for easy template access
-            ticker.data_start_date = date_range['start_date']
-            ticker.data_end_date = end_date
             ticker.data_days_old = days_old
         else:
-            ticker.data_start_date = None
-            ticker.data_end_date = None
             ticker.data_days_old = None
     
     # Check for outdated data (data older than 2 days)
@@ -151,11 +152,13 @@ def ticker_chart(request, ticker_symbol):
     # Get historical data
     start_date = datetime.now().date() - timedelta(days=days)
     
+    # Fetch plain rows instead of hydrating model instances; the chart only
+    # needs the OHLCV values and this can be thousands of rows
     ticker_data = TickerData.objects.filter(
         ticker=ticker,
         date__gte=start_date
-    ).order_by('date')
-    
+    ).order_by('date').values('date', 'open', 'high', 'low', 'close', 'volume')
+
     # Get all available data for date range info
     all_data_info = TickerData.objects.filter(ticker=ticker).aggregate(
         first_date=Min('date'),
@@ -217,6 +220,10 @@ def ticker_edit(request, ticker_symbol):
 # Chart Views
 # ====================
 
+# Lookback periods (in days) used for the gainers/losers table; defined once
+# rather than rebuilt per ticker
+GAIN_PERIODS = (1, 3, 5, 7, 10, 20, 40, 100)
+
 def charts(request):
     """Display charts page with links to different chart types."""
     return render(request, 'charts.html')
@@ -224,8 +231,12 @@ def charts(request):
 
 def charts_compare(request):
     """Display relative strength comparison between two tickers."""
-    # Get all active tickers for dropdown, ordered by market cap (descending)
-    tickers = Ticker.objects.filter(active=True).order_by('-market_cap', 'ticker')
+    # Dropdown contents only change when collectors run, so serve them from a
+    # short-lived cache instead of re-querying on every comparison
+    tickers = cache.get('charts_compare_tickers')
+    if tickers is None:
+        tickers = list(Ticker.objects.filter(active=True).order_by('-market_cap', 'ticker'))
+        cache.set('charts_compare_tickers', tickers, timeout=300)
     
     ticker1_symbol = request.GET.get('ticker1')
     ticker2_symbol = request.GET.get('ticker2')
@@ -249,24 +260,22 @@ def charts_compare(request):
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days)
             
-            # Get price data for both tickers
-            data1 = TickerData.objects.filter(
-                ticker=ticker1,
+            # Get both tickers' windows in one query and split in Python
+            rows = TickerData.objects.filter(
+                ticker__in=[ticker1, ticker2],
                 date__gte=start_date,
                 date__lte=end_date
-            ).order_by('date')
+            ).values_list('ticker_id', 'date', 'close')
             
-            data2 = TickerData.objects.filter(
-                ticker=ticker2,
-                date__gte=start_date,
-                date__lte=end_date
-            ).order_by('date')
+            prices1 = {}
+            prices2 = {}
+            for ticker_id, row_date, close in rows:
+                if ticker_id == ticker1.id:
+                    prices1[str(row_date)] = close
+                else:
+                    prices2[str(row_date)] = close
             
-            if data1 and data2:
-                # Create date-indexed dictionaries
-                prices1 = {str(d.date): d.close for d in data1}
-                prices2 = {str(d.date): d.close for d in data2}
-                
+            if prices1 and prices2:
                 # Find common dates
                 common_dates = sorted(set(prices1.keys()) & set(prices2.keys()))
                 
@@ -274,14 +283,28 @@ def charts_compare(request):
                     # Normalize to starting prices (index to 100)
                     start_price1 = prices1[common_dates[0]]
                     start_price2 = prices2[common_dates[0]]
+                    rs_start_ratio = start_price1 / start_price2
                     
+                    # Build all series in one pass over the common dates; the
+                    # separate comprehensions re-did the two dict lookups per
+                    # date for every derived series
                     dates_list = common_dates
-                    ticker1_prices_list = [prices1[d] for d in common_dates]
-                    ticker2_prices_list = [prices2[d] for d in common_dates]
-                    ticker1_indexed_list = [(prices1[d] / start_price1) * 100 for d in common_dates]
-                    ticker2_indexed_list = [(prices2[d] / start_price2) * 100 for d in common_dates]
-                    relative_strength_list = [(prices1[d] / prices2[d]) for d in common_dates]
-                    rs_normalized_list = [((prices1[d] / prices2[d]) / (start_price1 / start_price2)) * 100 for d in common_dates]
+                    ticker1_prices_list = []
+                    ticker2_prices_list = []
+                    ticker1_indexed_list = []
+                    ticker2_indexed_list = []
+                    relative_strength_list = []
+                    rs_normalized_list = []
+                    for d in common_dates:
+                        p1 = prices1[d]
+                        p2 = prices2[d]
+                        rs = p1 / p2
+                        ticker1_prices_list.append(p1)
+                        ticker2_prices_list.append(p2)
+                        ticker1_indexed_list.append((p1 / start_price1) * 100)
+                        ticker2_indexed_list.append((p2 / start_price2) * 100)
+                        relative_strength_list.append(rs)
+                        rs_normalized_list.append((rs / rs_start_ratio) * 100)
                     
                     chart_data = {
                         'dates': json.dumps(dates_list),
@@ -315,24 +338,53 @@ def charts_compare(request):
 
 def top_gainers(request):
     """Display top gainers/losers chart."""
+    # Serve from a short-lived cached snapshot; recomputing gains hits the
+    # database once per ticker per period, which is too expensive per request
+    gains_data = cache.get('top_gainers_snapshot')
+
+    if gains_data is None:
+        gains_data = build_top_gainers_snapshot()
+        cache.set('top_gainers_snapshot', gains_data, timeout=300)
+
+    return render(request, 'top_gainers.html', {
+        'gains_data': gains_data,
+        'periods': GAIN_PERIODS
+    })
+
+
+def build_top_gainers_snapshot():
+    """Compute gains/losses for the top tickers by market cap."""
     # Get top 30 tickers by market cap
-    top_tickers = Ticker.objects.filter(
+    top_tickers = list(Ticker.objects.filter(
         market_cap__isnull=False,
         active=True
-    ).order_by('-market_cap')[:30]
-    
-    # Calculate gains/losses for each ticker
-    gains_data = []
+    ).order_by('-market_cap')[:30])
+
     today = datetime.now().date()
-    
+
+    # Load the whole price window in one query instead of one current-price
+    # query plus one query per ticker per period (~270 round-trips); the
+    # extra two weeks of slack lets gaps still find a closest-available price
+    window_start = today - timedelta(days=max(GAIN_PERIODS) + 14)
+    # The composite (ticker, date) index hands the rows back newest-first
+    # per ticker, so grouping preserves the order and no Python sort is needed
+    rows = TickerData.objects.filter(
+        ticker__in=top_tickers,
+        date__gte=window_start,
+        close__isnull=False
+    ).order_by('ticker_id', '-date').values_list('ticker_id', 'date', 'close')
+
+    history = {}
+    for ticker_id, row_date, close in rows:
+        history.setdefault(ticker_id, []).append((row_date, close))
+
+    gains_data = []
     for ticker in top_tickers:
-        # Get current price (most recent)
-        current_data = TickerData.objects.filter(ticker=ticker).order_by('-date').first()
-        
-        if not current_data:
+        prices = history.get(ticker.id)
+        if not prices:
             continue
-        
-        current_price = current_data.close
+
+        current_price = prices[0][1]
         ticker_gains = {
             'ticker': ticker.ticker,
             'name': ticker.name,
@@ -340,31 +392,22 @@ def top_gainers(request):
             'market_cap': ticker.market_cap,
             'current_price': current_price
         }
-        
-        # Calculate gains for different periods
-        periods = [1, 3, 5, 7, 10, 20, 40, 100]
-        for days in periods:
+
+        # Walk the newest-first price list for each period's reference price
+        for days in GAIN_PERIODS:
             target_date = today - timedelta(days=days)
-            
-            # Get price from that date (or closest available)
-            historical_data = TickerData.objects.filter(
-                ticker=ticker,
-                date__lte=target_date
-            ).order_by('-date').first()
-            
-            if historical_data and historical_data.close:
-                old_price = historical_data.close
-                change_percent = ((current_price - old_price) / old_price) * 100
-                ticker_gains[f'gain_{days}d'] = change_percent
+            old_price = next(
+                (close for row_date, close in prices if row_date <= target_date),
+                None
+            )
+            if old_price:
+                ticker_gains[f'gain_{days}d'] = ((current_price - old_price) / old_price) * 100
             else:
                 ticker_gains[f'gain_{days}d'] = None
-        
+
         gains_data.append(ticker_gains)
-    
-    return render(request, 'top_gainers.html', {
-        'gains_data': gains_data,
-        'periods': [1, 3, 5, 7, 10, 20, 40, 100]
-    })
+
+    return gains_data
 
 
 # ====================
@@ -373,13 +416,12 @@ def top_gainers(request):
 
 def indicator_types(request):
     """Display all indicator types."""
-    types = IndicatorType.objects.all().order_by('name')
-    
-    # Count indicators for each type
-    type_counts = {}
-    for ind_type in types:
-        count = Indicator.objects.filter(indicator_type=ind_type).count()
-        type_counts[ind_type.id] = count
+    # One grouped query for the per-type counts instead of a COUNT per row
+    types = IndicatorType.objects.annotate(
+        indicator_count=Count('indicator')
+    ).order_by('name')
+
+    type_counts = {ind_type.id: ind_type.indicator_count for ind_type in types}
     
     return render(request, 'indicator_types.html', {
         'types': types,
@@ -404,12 +446,13 @@ def indicator_type_create(request):
             return redirect('indicator_type_create')
         
         # Create new indicator type
+        now_iso = datetime.now().isoformat()
         IndicatorType.objects.create(
             name=name,
             description=description,
             color=color,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
+            created_at=now_iso,
+            updated_at=now_iso
         )
         
         messages.success(request, f'Indicator type "{name}" created successfully!')
@@ -482,14 +525,14 @@ def indicator_type_delete(request, type_id):
 
 def indicators(request):
     """Display all indicators."""
-    indicators_with_types = []
-    indicators_list = Indicator.objects.all().order_by('-created_at')
-    
-    for indicator in indicators_list:
-        indicators_with_types.append({
-            'indicator': indicator,
-            'type': indicator.indicator_type
-        })
+    # select_related joins the type in the listing query; the loop's
+    # indicator.indicator_type access was one extra query per indicator
+    indicators_list = Indicator.objects.select_related('indicator_type').order_by('-created_at')
+
+    indicators_with_types = [
+        {'indicator': indicator, 'type': indicator.indicator_type}
+        for indicator in indicators_list
+    ]
     
     return render(request, 'indicators.html', {
         'indicators_with_types': indicators_with_types
@@ -524,15 +567,17 @@ def indicator_create(request):
             except json.JSONDecodeError as e:
                 messages.error(request, f'Invalid JSON in calculator config: {str(e)}')
                 types = IndicatorType.objects.all().order_by('name')
-                indicator_obj = type('obj', (object,), {
-                    'title': title,
-                    'description': description,
-                    'url': url,
-                    'indicator_type_id': type_id,
-                    'auto_update': auto_update,
-                    'calculator_class': calculator_class,
-                    'calculator_config_json': calculator_config
-                })
+                # SimpleNamespace echoes the form values back to the
+                # template without minting a throwaway class per request
+                indicator_obj = SimpleNamespace(
+                    title=title,
+                    description=description,
+                    url=url,
+                    indicator_type_id=type_id,
+                    auto_update=auto_update,
+                    calculator_class=calculator_class,
+                    calculator_config_json=calculator_config
+                )
                 return render(request, 'indicator_form.html', {
                     'mode': 'create',
                     'indicator': indicator_obj,
@@ -540,6 +585,7 @@ def indicator_create(request):
                 })
         
         try:
+            now_iso = datetime.now().isoformat()
             indicator = Indicator.objects.create(
                 title=title,
                 description=description,
@@ -548,8 +594,8 @@ def indicator_create(request):
                 auto_update=auto_update,
                 calculator_class=calculator_class if calculator_class else None,
                 calculator_config=calculator_config_json,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
+                created_at=now_iso,
+                updated_at=now_iso
             )
             
             messages.success(request, f'Indicator "{title}" created successfully')
@@ -648,9 +694,6 @@ def indicator_delete(request, indicator_id):
 
 def indicator_data_list(request, indicator_id):
     """View all data points for an indicator."""
-    from datetime import timedelta
-    import json
-    
     indicator = get_object_or_404(Indicator, id=indicator_id)
     
     # Get all data points for this indicator, ordered by date desc
@@ -668,18 +711,24 @@ def indicator_data_list(request, indicator_id):
             'updated_at': dp.updated_at
         })
     
-    # Get statistics
+    # Get statistics in a single aggregate; building a Python list of values
+    # re-executed the full queryset a second time
     stats = None
-    if data_points.exists():
-        values = [d.value for d in data_points]
+    if data_points_with_position:
+        agg = IndicatorData.objects.filter(indicator=indicator).aggregate(
+            count=Count('id'),
+            avg=Avg('value'),
+            min=Min('value'),
+            max=Max('value')
+        )
         stats = {
-            'count': len(values),
-            'avg': sum(values) / len(values),
-            'min': min(values),
-            'max': max(values),
-            'range': max(values) - min(values),
-            'latest': data_points[0].value,
-            'latest_date': data_points[0].date
+            'count': agg['count'],
+            'avg': agg['avg'],
+            'min': agg['min'],
+            'max': agg['max'],
+            'range': agg['max'] - agg['min'],
+            'latest': data_points_with_position[0]['value'],
+            'latest_date': data_points_with_position[0]['date']
         }
     
     # Get chart data for last 4 weeks
@@ -747,12 +796,13 @@ def indicator_data_add(request, indicator_id):
                 })
             
             # Create new data point
+            now_iso = datetime.now().isoformat()
             IndicatorData.objects.create(
                 indicator=indicator,
                 date=date_obj,
                 value=value,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
+                created_at=now_iso,
+                updated_at=now_iso
             )
             
             messages.success(request, f'Data point added for {date_str}')
@@ -910,6 +960,16 @@ def indicator_bulk_entry(request):
             date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
             
             # Collect all indicator values from form
+            # One timestamp for the whole batch instead of per-row calls
+            now_iso = datetime.now().isoformat()
+
+            # Fetch all existing data points for this date in a single query
+            # instead of one existence check per indicator
+            existing_by_indicator = {
+                dp.indicator_id: dp
+                for dp in IndicatorData.objects.filter(date=date_obj)
+            }
+
             saved_count = 0
             updated_count = 0
             skipped_count = 0
@@ -931,15 +991,12 @@ def indicator_bulk_entry(request):
                         continue
                     
                     # Check if data point already exists for this date
-                    existing = IndicatorData.objects.filter(
-                        indicator=indicator,
-                        date=date_obj
-                    ).first()
-                    
+                    existing = existing_by_indicator.get(indicator.id)
+
                     if existing:
                         # Update existing
                         existing.value = value
-                        existing.updated_at = datetime.now().isoformat()
+                        existing.updated_at = now_iso
                         existing.save()
                         updated_count += 1
                     else:
@@ -948,8 +1005,8 @@ def indicator_bulk_entry(request):
                             indicator=indicator,
                             date=date_obj,
                             value=value,
-                            created_at=datetime.now().isoformat(),
-                            updated_at=datetime.now().isoformat()
+                            created_at=now_iso,
+                            updated_at=now_iso
                         )
                         saved_count += 1
                     
@@ -1057,36 +1114,49 @@ def indicator_data_range_entry(request, indicator_id):
                     'today': datetime.now().date().isoformat()
                 })
             
-            # Process each date
-            added_count = 0
-            updated_count = 0
+            # Process the whole range as one batch: a single query for
+            # existing rows, one bulk INSERT and one bulk UPDATE, instead of
+            # two statements per date
+            now_iso = datetime.now().isoformat()
+
+            existing_by_date = {
+                dp.date: dp
+                for dp in IndicatorData.objects.filter(
+                    indicator=indicator,
+                    date__in=dates_to_process
+                )
+            }
+
+            new_points = []
+            updates = []
             skipped_count = 0
-            
+
             for date in dates_to_process:
-                # Check if data already exists
-                existing = IndicatorData.objects.filter(
-                    indicator=indicator,
-                    date=date
-                ).first()
-                
+                existing = existing_by_date.get(date)
+
                 if existing:
                     if overwrite_existing:
                         existing.value = value
-                        existing.updated_at = datetime.now().isoformat()
-                        existing.save()
-                        updated_count += 1
+                        existing.updated_at = now_iso
+                        updates.append(existing)
                     else:
                         skipped_count += 1
                 else:
-                    # Create new data point
-                    IndicatorData.objects.create(
+                    new_points.append(IndicatorData(
                         indicator=indicator,
                         date=date,
                         value=value,
-                        created_at=datetime.now().isoformat(),
-                        updated_at=datetime.now().isoformat()
-                    )
-                    added_count += 1
+                        created_at=now_iso,
+                        updated_at=now_iso
+                    ))
+
+            if new_points:
+                IndicatorData.objects.bulk_create(new_points)
+            if updates:
+                IndicatorData.objects.bulk_update(updates, ['value', 'updated_at'])
+
+            added_count = len(new_points)
+            updated_count = len(updates)
             
             # Build success message
             messages_list = []
@@ -1126,68 +1196,51 @@ def indicator_aggregate(request):
     
     # Get all indicator types
     indicator_types_list = IndicatorType.objects.all().order_by('name')
-    
-    # Get all indicators with their types
-    indicators_list = Indicator.objects.all()
-    
-    # Create a mapping of indicator_id to type
-    indicator_type_map = {}
-    for indicator in indicators_list:
-        indicator_type_map[indicator.id] = indicator.indicator_type_id
-    
-    # Query all indicator data within date range
-    data_query = IndicatorData.objects.filter(
+
+    # Aggregate in the database: one grouped query per date and one per
+    # date/type, instead of pulling every data point into Python
+    overall_rows = IndicatorData.objects.filter(
         date__gte=start_date,
         date__lte=end_date
-    ).order_by('-date').values('date', 'indicator_id', 'value')
-    
-    # Organize data by date
+    ).values('date').annotate(
+        average=Avg('value'),
+        count=Count('id')
+    )
+
+    type_rows = IndicatorData.objects.filter(
+        date__gte=start_date,
+        date__lte=end_date,
+        indicator__indicator_type__isnull=False
+    ).values('date', 'indicator__indicator_type_id').annotate(
+        average=Avg('value'),
+        count=Count('id'),
+        min_value=Min('value'),
+        max_value=Max('value')
+    )
+
+    # Organize aggregated rows by date
     daily_data = {}
-    for data_point in data_query:
-        date_str = str(data_point['date'])
-        if date_str not in daily_data:
-            daily_data[date_str] = {
-                'date': data_point['date'],
-                'by_type': {},
-                'overall': []
-            }
-        
-        # Get the type for this indicator
-        type_id = indicator_type_map.get(data_point['indicator_id'])
-        
-        if type_id:
-            if type_id not in daily_data[date_str]['by_type']:
-                daily_data[date_str]['by_type'][type_id] = []
-            daily_data[date_str]['by_type'][type_id].append(data_point['value'])
-        
-        # Add to overall
-        daily_data[date_str]['overall'].append(data_point['value'])
-    
-    # Calculate averages for each date
-    aggregated_data = []
-    for date_str, data in sorted(daily_data.items(), reverse=True):
-        date_info = {
-            'date': data['date'],
+    for row in overall_rows:
+        daily_data[row['date']] = {
+            'date': row['date'],
             'type_averages': {},
-            'overall_average': None,
-            'data_points_count': len(data['overall'])
+            'overall_average': row['average'],
+            'data_points_count': row['count']
         }
-        
-        # Calculate type averages
-        for type_id, values in data['by_type'].items():
-            if values:
-                date_info['type_averages'][type_id] = {
-                    'average': sum(values) / len(values),
-                    'count': len(values),
-                    'min': min(values),
-                    'max': max(values)
-                }
-        
-        # Calculate overall average
-        if data['overall']:
-            date_info['overall_average'] = sum(data['overall']) / len(data['overall'])
-        
-        aggregated_data.append(date_info)
+
+    for row in type_rows:
+        date_info = daily_data.get(row['date'])
+        if date_info is None:
+            continue
+        date_info['type_averages'][row['indicator__indicator_type_id']] = {
+            'average': row['average'],
+            'count': row['count'],
+            'min': row['min_value'],
+            'max': row['max_value']
+        }
+
+    # Most recent dates first
+    aggregated_data = [daily_data[d] for d in sorted(daily_data, reverse=True)]
     
     # Get statistics for each type
     type_stats = {}
@@ -1221,31 +1274,49 @@ def indicator_aggregate(request):
 
 class CachedOutput(StringIO):
     """Custom output stream that writes to cache for real-time progress updates."""
-    def __init__(self, cache_key):
+    def __init__(self, cache_key, command_name=None):
         super().__init__()
         self.cache_key = cache_key
-        cache.set(cache_key, {'output': '', 'status': 'running', 'progress': 0}, timeout=3600)
+        self.data = {
+            'output': '',
+            'status': 'running',
+            'progress': 0,
+            'command': command_name,
+            'started_at': datetime.now().isoformat()
+        }
+        cache.set(cache_key, self.data, timeout=3600)
     
     def write(self, s):
         super().write(s)
-        # Update cache with new output
-        data = cache.get(self.cache_key, {})
-        data['output'] = self.getvalue()
-        cache.set(self.cache_key, data, timeout=3600)
+        # Update cache with new output; the entry is tracked locally so each
+        # line costs one cache write instead of a read-modify-write pair
+        self.data['output'] = self.getvalue()
+        cache.set(self.cache_key, self.data, timeout=3600)
         return len(s)
 
 
+def register_task(task_id):
+    """Record a task id in the cache-backed registry of recent tasks.
+
+    Keeps the last 10 task ids so task listings are a single cache read
+    instead of probing every possible task key.
+    """
+    recent = cache.get('update_task_index', [])
+    recent.insert(0, task_id)
+    del recent[10:]
+    cache.set('update_task_index', recent, timeout=3600)
+
+
 def run_command_in_background(command_name, task_id):
     """Run a Django management command in the background."""
     try:
-        output = CachedOutput(f'update_task_{task_id}')
+        output = CachedOutput(f'update_task_{task_id}', command_name=command_name)
         call_command(command_name, stdout=output, stderr=output)
         
         # Mark as complete
-        data = cache.get(f'update_task_{task_id}', {})
-        data['status'] = 'completed'
-        data['progress'] = 100
-        cache.set(f'update_task_{task_id}', data, timeout=3600)
+        output.data['status'] = 'completed'
+        output.data['progress'] = 100
+        cache.set(f'update_task_{task_id}', output.data, timeout=3600)
     except Exception as e:
         # Mark as failed
         data = cache.get(f'update_task_{task_id}', {})
@@ -1256,7 +1327,24 @@ def run_command_in_background(command_name, task_id):
 
 def data_updates(request):
     """Display data updates page with options to run update scripts."""
-    return render(request, 'data_updates.html')
+    # Recent tasks come from the cache-backed registry: one read for the
+    # index plus one per task, no worker polling
+    recent_tasks = []
+    for task_id in cache.get('update_task_index', []):
+        data = cache.get(f'update_task_{task_id}')
+        if data:
+            recent_tasks.append({'task_id': task_id, **data})
+
+    return render(request, 'data_updates.html', {'recent_tasks': recent_tasks})
+
+
+# Map update types to either Django management commands or legacy scripts;
+# module-level so the table is built once, not per POST
+UPDATE_CONFIG = {
+    'ticker_data': {'type': 'command', 'name': 'update_ticker_data', 'display': 'Ticker Data Update'},
+    'tickers': {'type': 'command', 'name': 'update_tickers', 'display': 'Ticker List Update'},
+    'coingecko': {'type': 'command', 'name': 'update_market_cap', 'display': 'CoinGecko Market Caps Update'}
+}
 
 
 def run_update(request, update_type):
@@ -1264,28 +1352,22 @@ def run_update(request, update_type):
     if request.method != 'POST':
         return redirect('data_updates')
     
-    # Get the project root directory for legacy scripts
-    django_app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    project_root = os.path.dirname(django_app_dir)
-    
-    # Map update types to either Django management commands or legacy scripts
-    update_config = {
-        'ticker_data': {'type': 'command', 'name': 'update_ticker_data', 'display': 'Ticker Data Update'},
-        'tickers': {'type': 'command', 'name': 'update_tickers', 'display': 'Ticker List Update'},
-        'coingecko': {'type': 'command', 'name': 'update_market_cap', 'display': 'CoinGecko Market Caps Update'}
-    }
-    
-    if update_type not in update_config:
+    if update_type not in UPDATE_CONFIG:
         messages.error(request, f'Invalid update type: {update_type}')
         return redirect('data_updates')
     
-    config = update_config[update_type]
+    config = UPDATE_CONFIG[update_type]
     
+    # Imported lazily: only the legacy-script path needs subprocess
+    import subprocess
+    import sys
+
     try:
         if config['type'] == 'command':
             # Generate unique task ID
             task_id = str(uuid.uuid4())
-            
+            register_task(task_id)
+
             # Start command in background thread
             thread = threading.Thread(
                 target=run_command_in_background,
@@ -1299,7 +1381,7 @@ def run_update(request, update_type):
         else:
             # Run as legacy script (synchronous for now)
             script_name = config['name']
-            script_path = os.path.join(project_root, script_name)
+            script_path = os.path.join(PROJECT_ROOT, script_name)
             
             if not os.path.exists(script_path):
                 error_msg = f'Update script not found: {script_name}'
@@ -1308,7 +1390,7 @@ def run_update(request, update_type):
             
             result = subprocess.run(
                 [sys.executable, script_path],
-                cwd=project_root,
+                cwd=PROJECT_ROOT,
                 capture_output=True,
                 text=True,
                 timeout=600,
@@ -1349,15 +1431,20 @@ def update_progress(request, task_id, update_name):
     })
 
 
+# Fast-path payload for the common "unknown task" poll; built once instead of
+# per request
+TASK_NOT_FOUND = {
+    'status': 'not_found',
+    'output': 'Task not found',
+    'progress': 0
+}
+
+
 def update_status(request, task_id):
     """API endpoint to check update task status."""
     data = cache.get(f'update_task_{task_id}')
-    
+
     if not data:
-        return JsonResponse({
-            'status': 'not_found',
-            'output': 'Task not found',
-            'progress': 0
-        })
-    
+        return JsonResponse(TASK_NOT_FOUND)
+
     return JsonResponse(data)